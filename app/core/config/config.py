@@ -1,6 +1,7 @@
+import os
 from typing import Any
 from pathlib import Path
-from functools import cached_property
+from functools import cached_property, lru_cache
 from fastapi.responses import HTMLResponse
 from pydantic_settings import BaseSettings
 
@@ -14,6 +15,8 @@ class Settings(BaseSettings):
         CORE_DIR (Path): The core directory within the application.
         MODULES_DIR (Path): The directory containing all modules.
         DATA_DIR (Path): The directory for application data.
+        JINJA_CACHE_DIR (Path): The directory for compiled Jinja2 template bytecode.
+        PRODUCTION (bool): Flag for production mode; disables template auto-reload.
         ENABLED_MODULES (list[str]): List of enabled modules for static files.
         POSTGRES_SUPERUSER (str): PostgreSQL superuser name.
         POSTGRES_PASSWORD (str): PostgreSQL superuser password.
@@ -21,12 +24,15 @@ class Settings(BaseSettings):
         POSTGRES_PORT (int): Port number for PostgreSQL.
         FASTAPI_PROPERTIES (dict): Default properties for FastAPI app.
         DISABLE_DOCS (bool): Flag to disable FastAPI documentation endpoints.
+        SESSION_SECRET (str): Secret key used to sign session cookies.
 
-    Properties:
+    Cached Properties (computed once per Settings instance):
         STATIC_DIRS (list[Path]): List of static directories, including core and enabled modules.
+        MODULE_STATIC_DIRS (tuple[tuple[str, Path], ...]): (module name, path) pairs for enabled modules whose static directory exists.
         TEMPLATE_DIRS (list[Path]): List of template directories, including core and enabled modules.
         MODULE_DATA_DIRS (list[Path]): List of data directories for each enabled module.
         CORE_DATA_DIR (Path): Data directory for the core module.
+        MODULE_I18N_DIRS (dict[str, Path]): i18n directory of every module found in MODULES_DIR, keyed by module name.
         fastapi_kwargs (dict[str, Any]): FastAPI keyword arguments, including documentation settings.
     """
 
@@ -34,16 +40,25 @@ class Settings(BaseSettings):
     CORE_DIR: Path = APP_DIR / "core"
     MODULES_DIR: Path = APP_DIR / "modules"
     DATA_DIR: Path = APP_DIR / "data"
+    JINJA_CACHE_DIR: Path = APP_DIR / ".jinja_cache"
+
+    PRODUCTION: bool = False  # Set True in production to skip template mtime checks
 
     ENABLED_MODULES: list[str] = ["onboarding"]  # Add the modules you want to enable for static files. here
 
-    @property
+    @cached_property
     def STATIC_DIRS(self) -> list[Path]:
         return [self.APP_DIR / "static"] + [
             self.MODULES_DIR / mod / "static" for mod in self.ENABLED_MODULES
         ]
 
-    # @property
+    @cached_property
+    def MODULE_STATIC_DIRS(self) -> tuple[tuple[str, Path], ...]:
+        return tuple(
+            (mod, path) for mod in self.ENABLED_MODULES
+            if (path := self.MODULES_DIR / mod / "static").is_dir()
+        )
+
     @cached_property
     def TEMPLATE_DIRS(self) -> list[Path]:
         base = [
@@ -58,14 +73,24 @@ class Settings(BaseSettings):
             module_dirs.append(module_base)                # for components/
         return base + module_dirs
 
-    @property
+    @cached_property
     def MODULE_DATA_DIRS(self) -> list[Path]:
         return [self.MODULES_DIR / mod / "data" for mod in self.ENABLED_MODULES]
 
-    @property
+    @cached_property
     def CORE_DATA_DIR(self) -> Path:
         return self.CORE_DIR / "data"
 
+    @cached_property
+    def MODULE_I18N_DIRS(self) -> dict[str, Path]:
+        if not self.MODULES_DIR.is_dir():
+            return {}
+        with os.scandir(self.MODULES_DIR) as entries:
+            return {
+                entry.name: Path(entry.path) / "i18n"
+                for entry in entries if entry.is_dir() and not entry.name.startswith(("_", "."))
+            }
+
 
     FASTAPI_PROPERTIES: dict = {
         "title": "Accompany",
@@ -76,7 +101,9 @@ class Settings(BaseSettings):
 
     DISABLE_DOCS: bool = True # Set True to disable /docs and redoc endpoints in production
 
-    @property
+    SESSION_SECRET: str = "<YOUR SECRET KEY>"  # Override via the SESSION_SECRET environment variable
+
+    @cached_property
     def fastapi_kwargs(self) -> dict[str, Any]:
         kwargs = self.FASTAPI_PROPERTIES.copy()
         if self.DISABLE_DOCS:
@@ -90,4 +117,26 @@ class Settings(BaseSettings):
         return kwargs
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Returns the process-wide Settings instance, creating it on first use.
+
+    Environment variables are parsed once, on the first call. Modules that import `settings`
+    bind this instance (and derive module-level values from it) at import time, so clearing
+    the cache afterwards does not affect them.
+
+    Returns:
+        Settings: The cached application settings.
+    """
+    return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Lazily resolves the module-level `settings` attribute so that existing
+    `from app.core.config.config import settings` imports keep working.
+    """
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
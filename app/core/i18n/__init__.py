@@ -1,16 +1,18 @@
 from app.core.config.config import settings
-from app.core.i18n.locale import compile_translations
+from app.core.i18n.locale import clear_translation_cache, compile_translations
 
 def compile_all_translations():
     """
     Compiles translation files for all enabled modules.
 
-    Iterates through each module listed in `settings.ENABLED_MODULES`, constructs the path to its `i18n` directory,
-    and if the directory exists, compiles the translation files within it using `compile_translations`.
+    Iterates through each module listed in `settings.ENABLED_MODULES`, looks up its `i18n` directory in
+    `settings.MODULE_I18N_DIRS`, and if the directory exists, compiles the translation files within it
+    using `compile_translations`. Cached translation catalogs are cleared afterwards, so the next lookup re-reads the recompiled .mo files.
 
-    Assumes the existence of `settings.ENABLED_MODULES`, `settings.MODULES_DIR`, and a `compile_translations` function.
+    Assumes the existence of `settings.ENABLED_MODULES`, `settings.MODULE_I18N_DIRS`, and a `compile_translations` function.
     """
     for module in settings.ENABLED_MODULES:
-        i18n_path = settings.MODULES_DIR / module / "i18n"
-        if i18n_path.exists():
+        i18n_path = settings.MODULE_I18N_DIRS.get(module)
+        if i18n_path is not None and i18n_path.exists():
             compile_translations(i18n_path)
+    clear_translation_cache()
@@ -1,20 +1,38 @@
+import os
 import polib
 import logging
 import gettext
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from typing import Callable
 
 DOMAIN = "messages"
 logger = logging.getLogger("i18n")
 
 
+def _compile_one(po_path: Path, mo_path: Path) -> None:
+    """
+    Compiles a single .po file to its .mo counterpart, logging the outcome.
+    """
+    try:
+        po = polib.pofile(str(po_path))
+        mo_path.parent.mkdir(parents=True, exist_ok=True)
+        po.save_as_mofile(str(mo_path))
+        logger.info(f"[i18n] Compiled {po_path} → {mo_path}")
+    except Exception as e:
+        logger.error(f"[i18n] Error compiling {po_path}: {e}")
+
+
 def compile_translations(i18n_root: Path) -> None:
     """
     Compiles all .po translation files to .mo files within the given i18n root directory.
 
     This function iterates over each locale directory inside the specified i18n_root,
     searches for .po files in the LC_MESSAGES subdirectory, and compiles them into
-    binary .mo files using polib. If the i18n_root does not exist, a warning is logged.
+    binary .mo files using polib. A .po file is skipped when its .mo is at least as new.
+    Stale locales are compiled concurrently on a thread pool.
+    If the i18n_root does not exist, a warning is logged.
     Any errors encountered during compilation are logged as errors.
 
     Args:
@@ -28,6 +46,7 @@ def compile_translations(i18n_root: Path) -> None:
         logger.warning(f"[i18n] No i18n directory found at {i18n_root}")
         return
 
+    pending = []
     for locale_dir in i18n_root.iterdir():
         if not locale_dir.is_dir():
             continue
@@ -38,13 +57,47 @@ def compile_translations(i18n_root: Path) -> None:
         if not po_path.exists():
             continue
 
-        try:
-            po = polib.pofile(str(po_path))
-            mo_path.parent.mkdir(parents=True, exist_ok=True)
-            po.save_as_mofile(str(mo_path))
-            logger.info(f"[i18n] Compiled {po_path} → {mo_path}")
-        except Exception as e:
-            logger.error(f"[i18n] Error compiling {po_path}: {e}")
+        if mo_path.exists() and mo_path.stat().st_mtime >= po_path.stat().st_mtime:
+            continue  # .mo is already up to date
+
+        pending.append((po_path, mo_path))
+
+    if len(pending) <= 1:
+        for po_path, mo_path in pending:
+            _compile_one(po_path, mo_path)
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+        list(executor.map(_compile_one, *zip(*pending)))
+
+
+@lru_cache(maxsize=64)
+def _load_translation(i18n_root: str, locale: str) -> gettext.NullTranslations:
+    """
+    Loads and caches the gettext catalog for a given i18n root and locale.
+
+    Repeated lookups skip the `gettext.find()` stat calls and the per-call copy of the
+    catalog. This is the only catalog cache: each .mo file is read once per (root, locale)
+    until `clear_translation_cache()` is called after recompiling.
+    """
+    # Built directly rather than via gettext.translation(), whose own process-wide cache
+    # (keyed by .mo path) would keep serving stale catalogs after a recompile.
+    translation = None
+    for mo_file in gettext.find(DOMAIN, i18n_root, [locale], all=True):
+        with open(mo_file, "rb") as fp:
+            catalog = gettext.GNUTranslations(fp)
+        if translation is None:
+            translation = catalog
+        else:
+            translation.add_fallback(catalog)
+    return translation if translation is not None else gettext.NullTranslations()
+
+
+def clear_translation_cache() -> None:
+    """
+    Drops all cached gettext catalogs so that the next lookup re-reads freshly compiled .mo files.
+    """
+    _load_translation.cache_clear()
 
 
 def get_translations(i18n_root: Path, locale: str) -> Callable[[str], str]:
@@ -54,6 +107,7 @@ def get_translations(i18n_root: Path, locale: str) -> Callable[[str], str]:
     Attempts to load translation files from the given i18n_root directory for the provided locale.
     If translation files are found, returns a function that translates input strings.
     If not found or an error occurs, returns an identity function that returns the input string unchanged.
+    Loaded catalogs are cached per (i18n_root, locale), see `_load_translation`.
 
     Args:
         i18n_root (Path): The root directory containing locale translation files.
@@ -64,13 +118,7 @@ def get_translations(i18n_root: Path, locale: str) -> Callable[[str], str]:
     """
 
     try:
-        translation = gettext.translation(
-            DOMAIN,
-            localedir=i18n_root,
-            languages=[locale],
-            fallback=True
-        )
-        return translation.gettext
+        return _load_translation(str(i18n_root), locale).gettext
     except Exception as e:
         logger.warning(f"[i18n] No translation found for locale '{locale}' in {i18n_root}: {e}")
         return lambda s: s
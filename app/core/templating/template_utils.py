@@ -1,86 +1,251 @@
 # app/core/templating/template_utils.py
 
+import os
+import hashlib
+import logging
 from pathlib import Path
+from contextvars import ContextVar, Token
+from typing import Callable, NamedTuple
 from fastapi import Request
-from fastapi.responses import HTMLResponse
+from fastapi.responses import Response
 from fastapi.templating import Jinja2Templates
-from jinja2 import Environment, ChoiceLoader, FileSystemLoader
+from jinja2 import Environment, ChoiceLoader, FileSystemBytecodeCache, FileSystemLoader
 
 from app.core.config.config import settings
 from app.core.i18n.locale import get_translations
 
+logger = logging.getLogger("templating")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Jinja Environment Setup
 # ─────────────────────────────────────────────────────────────────────────────
 
-def create_jinja_environment(template_dirs: list[Path]) -> Environment:
+# Translator for the template currently being rendered. Each request runs in its own
+# context, so concurrent renders never see each other's locale.
+_current_translator: ContextVar[Callable[[str], str]] = ContextVar("current_translator", default=lambda s: s)
+
+def _translate(s: str) -> str:
+    return _current_translator.get()(s)
+
+def create_jinja_environment(template_dirs: list[Path], auto_reload: bool = True) -> Environment:
     """
     Creates and configures a Jinja2 Environment with the specified template directories.
 
     Args:
         template_dirs (list[Path]): A list of Path objects representing directories to search for templates.
+        auto_reload (bool): Whether to check template mtimes and recompile changed templates.
 
     Returns:
         Environment: A configured Jinja2 Environment instance with a ChoiceLoader for the provided directories and a default no-op translation function.
 
     Note:
-        The environment is set to autoescape by default, and the global '_' is set as a no-operation translation function.
+        The environment is set to autoescape by default, and the global '_' delegates to the
+        translator held in `_current_translator`, which is a no-op unless a locale is applied.
     """
     loaders = [FileSystemLoader(str(p)) for p in template_dirs]
-    env = Environment(loader=ChoiceLoader(loaders), autoescape=True)
-    env.globals["_"] = lambda s: s  # Default noop translation
+    env = Environment(
+        loader=ChoiceLoader(loaders),
+        autoescape=True,
+        auto_reload=auto_reload,
+        cache_size=-1,  # Never evict compiled templates; the template set is small and fixed
+    )
+    env.globals["_"] = _translate  # Resolved per render via _current_translator
     return env
 
-env = create_jinja_environment(settings.TEMPLATE_DIRS)
+env = create_jinja_environment(settings.TEMPLATE_DIRS, auto_reload=not settings.PRODUCTION)
 templates = Jinja2Templates(env=env)
 
+
+def enable_bytecode_cache(env: Environment, directory: Path) -> bool:
+    """
+    Persists compiled template bytecode in `directory` so warm restarts skip template compilation.
+
+    Called from the app lifespan rather than at import, so importing this module never writes to
+    disk. If the directory cannot be created (e.g. a read-only filesystem), bytecode is only
+    cached in memory.
+
+    Args:
+        env (Environment): The Jinja2 environment to attach the cache to.
+        directory (Path): The bytecode cache directory, created if missing.
+
+    Returns:
+        bool: True if the persistent cache was enabled, False otherwise.
+    """
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"[templating] Bytecode cache disabled, cannot create {directory}: {e}")
+        return False
+    env.bytecode_cache = FileSystemBytecodeCache(directory=str(directory))
+    return True
+
+
+def _etag_salt(source_dirs: list[Path]) -> bytes:
+    """
+    Derives the ETag salt from the app version and the newest file mtime in the given directories.
+
+    Every worker of a deploy computes the same salt, while a new version, any edited template
+    or any recompiled catalog invalidates previously issued ETags. Files that vanish or cannot
+    be stat'ed during the walk (e.g. dangling symlinks) are skipped.
+    """
+    newest = 0
+    for base_path in source_dirs:
+        for dirpath, _dirnames, filenames in os.walk(str(base_path), followlinks=False):
+            for filename in filenames:
+                try:
+                    newest = max(newest, os.stat(os.path.join(dirpath, filename)).st_mtime_ns)
+                except OSError:
+                    continue
+    return f"{settings.FASTAPI_PROPERTIES.get('version', '')}:{newest}".encode()
+
+
+_ETAG_SALT: bytes | None = None
+
+
+def refresh_etag_salt() -> None:
+    """
+    Recomputes the ETag salt from the template directories and the compiled translation catalogs.
+
+    Called by the application lifespan once translations have been compiled, so the salt reflects
+    the .mo files actually served. `compute_etag()` falls back to computing it on first use.
+    """
+    global _ETAG_SALT
+    i18n_dirs = [settings.CORE_DIR / "i18n", *settings.MODULE_I18N_DIRS.values()]
+    _ETAG_SALT = _etag_salt([*settings.TEMPLATE_DIRS, *i18n_dirs])
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Template Index (resolved once at startup)
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TemplateMeta(NamedTuple):
+    """
+    Ownership metadata for a template, resolved from its location on disk.
+
+    Attributes:
+        kind (str | None): "module" or "core", or None if the template belongs to neither.
+        module_name (str | None): The owning module name, or the core sub-package (e.g. "ui").
+        i18n_root (Path | None): The i18n directory used to translate the template.
+        base_template (str | None): The `<name>_base.html` layout the template is injected into.
+    """
+    kind: str | None
+    module_name: str | None
+    i18n_root: Path | None
+    base_template: str | None
+
+
+def _template_meta(full_path: str) -> TemplateMeta:
+    """
+    Derives the TemplateMeta for a template file from the "modules"/"core" segment of its path.
+    """
+    parts = full_path.split(os.sep)
+    try:
+        if "modules" in parts:
+            module_name = parts[parts.index("modules") + 1]
+            return TemplateMeta("module", module_name, settings.MODULE_I18N_DIRS.get(module_name), f"{module_name}_base.html")
+        elif "core" in parts:
+            package_name = parts[parts.index("core") + 1]
+            return TemplateMeta("core", package_name, settings.CORE_DIR / "i18n", f"{package_name}_base.html")
+    except IndexError:
+        pass
+    return TemplateMeta(None, None, None, None)
+
+
+def build_template_index(template_dirs: list[Path]) -> dict[str, TemplateMeta]:
+    """
+    Walks every template directory once and maps each relative template path to its TemplateMeta.
+
+    Directories are scanned in order and, like the loader, the first directory that provides a
+    module- or core-owned template wins.
+
+    Args:
+        template_dirs (list[Path]): The template directories, in loader priority order.
+
+    Returns:
+        dict[str, TemplateMeta]: Relative template paths ("/"-separated) mapped to their metadata.
+    """
+    index: dict[str, TemplateMeta] = {}
+    for base_path in template_dirs:
+        base = str(base_path)
+        for dirpath, _dirnames, filenames in os.walk(base, followlinks=False):
+            for filename in filenames:
+                full_path = os.path.join(dirpath, filename)
+                rel_path = os.path.relpath(full_path, base).replace(os.sep, "/")
+                existing = index.get(rel_path)
+                if existing is not None and existing.kind is not None:
+                    continue
+                index[rel_path] = _template_meta(full_path)
+    return index
+
+_TEMPLATE_DIRS_STR = tuple(str(p) for p in settings.TEMPLATE_DIRS)
+_TEMPLATE_INDEX = build_template_index(settings.TEMPLATE_DIRS)
+
+
+def get_template_meta(template_path: str) -> TemplateMeta | None:
+    """
+    Returns the TemplateMeta for a template, or None if no template directory provides it.
+
+    Lookups are served from the startup index. Templates added after startup are resolved from
+    disk on first use and then indexed.
+    """
+    meta = _TEMPLATE_INDEX.get(template_path)
+    if meta is not None:
+        return meta
+
+    for base_dir in _TEMPLATE_DIRS_STR:
+        full_path = os.path.join(base_dir, template_path)
+        if os.path.exists(full_path):
+            meta = _template_meta(os.path.normpath(full_path))
+            if meta.kind is not None:
+                _TEMPLATE_INDEX[template_path] = meta
+                return meta
+    return meta
+
 # ─────────────────────────────────────────────────────────────────────────────
 # i18n Injection (module-aware)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def apply_module_locale(env: Environment, template_path: str, request: Request):
+def resolve_template(template_path: str, locale: str) -> tuple[Callable[[str], str], str | None]:
+    """
+    Resolves both the translator and the base layout for a template with a single index lookup.
+
+    Args:
+        template_path (str): The relative path to the template being rendered.
+        locale (str): The locale code to translate into.
+
+    Returns:
+        tuple[Callable[[str], str], str | None]: The translation function (identity if the template
+        has no i18n root) and the `<name>_base.html` layout, or None if there is none.
+    """
+    meta = get_template_meta(template_path)
+    if meta is None:
+        return (lambda s: s), None
+    if meta.i18n_root is None:
+        return (lambda s: s), meta.base_template
+    return get_translations(meta.i18n_root, locale), meta.base_template
+
+
+def apply_module_locale(template_path: str, request: Request) -> Token:
     """
-    Configures the Jinja2 environment with locale-specific translations for a given template.
+    Activates locale-specific translations for a given template in the current context.
 
     This function determines the appropriate translation function based on the template's
     location (module or core) and the user's locale (from cookies). It sets the translation
-    function as the global '_' in the Jinja2 environment, enabling template-level i18n.
+    function on `_current_translator`, which the environment's '_' global reads at render time.
+    The template's location is read from the startup template index.
 
     Args:
-        env (Environment): The Jinja2 environment to configure.
         template_path (str): The relative path to the template being rendered.
         request (Request): The incoming request object, used to extract the user's locale.
 
-    Side Effects:
-        Modifies env.globals by setting the '_' key to the appropriate translation function.
+    Returns:
+        Token: The context variable token; pass it to `_current_translator.reset()` once rendered.
 
     Fallback:
-        If no translation is found, sets '_' to an identity function (returns input string).
+        If no translation is found, activates an identity function (returns input string).
     """
-    locale = request.cookies.get("locale", "en")
-
-    for base_path in settings.TEMPLATE_DIRS:
-        full_path = base_path / template_path
-        if full_path.exists():
-            parts = full_path.parts
-            if "modules" in parts:
-                # It's a module template → resolve module name
-                try:
-                    mod_index = parts.index("modules")
-                    module_name = parts[mod_index + 1]
-                    i18n_root = settings.MODULES_DIR / module_name / "i18n"
-                    env.globals["_"] = get_translations(i18n_root, locale)
-                    return
-                except Exception:
-                    pass
-            elif "core" in parts:
-                # It's a core template → use core-level locale if needed
-                i18n_root = settings.CORE_DIR / "i18n"
-                env.globals["_"] = get_translations(i18n_root, locale)
-                return
-
-    # Fallback: no translation found
-    env.globals["_"] = lambda s: s
+    translator, _base_template = resolve_template(template_path, request.cookies.get("locale", "en"))
+    return _current_translator.set(translator)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Base Template Resolver
@@ -90,11 +255,10 @@ def guess_base_template(template_path: str) -> str | None:
     """
     Attempts to determine the appropriate base template filename for a given template path.
 
-    This function iterates through the directories specified in `settings.TEMPLATE_DIRS`, 
-    constructs the full path to the template, and checks if it exists. If the template is found 
-    within a directory named "modules" or "core", it returns the base template name in the format 
-    `<module_or_core_name>_base.html`, where `<module_or_core_name>` is the immediate subdirectory 
-    following "modules" or "core" in the path.
+    The template is looked up in the startup template index built from `settings.TEMPLATE_DIRS`.
+    If it was found within a directory named "modules" or "core", this returns the base template
+    name in the format `<module_or_core_name>_base.html`, where `<module_or_core_name>` is the
+    immediate subdirectory following "modules" or "core" in the path.
 
     Args:
         template_path (str): The relative path to the template file.
@@ -102,26 +266,47 @@ def guess_base_template(template_path: str) -> str | None:
     Returns:
         str | None: The guessed base template filename if found, otherwise None.
     """
-    for base_path in settings.TEMPLATE_DIRS:
-        full_path = base_path / template_path
-        if full_path.exists():
-            parts = full_path.parts
-            try:
-                if "modules" in parts:
-                    mod_index = parts.index("modules")
-                    return f"{parts[mod_index + 1]}_base.html"
-                elif "core" in parts:
-                    mod_index = parts.index("core")
-                    return f"{parts[mod_index + 1]}_base.html"
-            except IndexError:
-                return None
-    return None
+    meta = get_template_meta(template_path)
+    return meta.base_template if meta is not None else None
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Render Entrypoints
 # ─────────────────────────────────────────────────────────────────────────────
 
-def render(template_path: str, request: Request, context: dict) -> HTMLResponse:
+def compute_etag(template_path: str, locale: str, context: dict) -> str:
+    """
+    Computes a quoted ETag for a page render from its template, locale and context.
+
+    The request object is excluded from the digest, so only pages whose output depends on
+    nothing but the template, locale and context may use it (see `render(..., etag=True)`).
+    Context values are hashed through their repr, so values without a stable repr simply
+    yield an ETag that never matches.
+    """
+    if _ETAG_SALT is None:
+        refresh_etag_salt()
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(_ETAG_SALT)
+    digest.update(template_path.encode())
+    digest.update(locale.encode())
+    items = sorted((k, v) for k, v in context.items() if k != "request")
+    digest.update(repr(items).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag_value: str) -> bool:
+    """
+    Checks an If-None-Match header against an ETag using weak comparison (RFC 9110, section 13.1.2).
+
+    A `W/` prefix on a candidate is ignored and `*` matches any current representation.
+    """
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag_value:
+            return True
+    return False
+
+
+def render(template_path: str, request: Request, context: dict, etag: bool = False) -> Response:
     """
     Renders a template with the given context and request, handling HTMX requests and base template injection.
 
@@ -129,37 +314,59 @@ def render(template_path: str, request: Request, context: dict) -> HTMLResponse:
         template_path (str): The path to the template to render.
         request (Request): The current HTTP request object.
         context (dict): The context dictionary to pass to the template.
+        etag (bool): Opt in to ETag revalidation. Only enable for idempotent pages whose output
+            does not depend on the session, cookies other than the locale, query params or other
+            request state, since the request is not part of the ETag.
 
     Returns:
-        HTMLResponse: The rendered HTML response.
+        Response: The rendered HTML response, or an empty 304 response if the client's cached copy is current.
 
     Raises:
         ValueError: If attempting to render a base layout template directly.
 
     Behavior:
         - Injects the request into the context.
-        - Applies locale settings to the template environment.
+        - Prevents direct rendering of base layout templates (before any locale work).
+        - Resolves the template's translator and base layout in one lookup, and activates the
+          translator for the duration of the render.
         - If the request is an HTMX request, renders the template directly.
-        - Prevents direct rendering of base layout templates.
+        - If `etag` is set, for full-page GETs with template auto-reload disabled, tags the response with an ETag
+          and answers an If-None-Match that weakly matches it (or `*`) with 304 Not Modified without rendering.
         - If a base template is detected, injects the content template and renders the base.
         - Otherwise, renders the specified template.
     """
     context["request"] = request
+    is_htmx = request.headers.get("hx-request") == "true"
 
-    apply_module_locale(env, template_path, request)
+    if not is_htmx and template_path.endswith("_base.html"):
+        raise ValueError(f"Refusing to inject layout template directly: {template_path}")
+
+    locale = request.cookies.get("locale", "en")
 
-    if request.headers.get("hx-request") == "true":
-        return templates.TemplateResponse(template_path, context)
+    etag_value = None
+    if etag and not is_htmx and request.method == "GET" and not env.auto_reload:
+        etag_value = compute_etag(template_path, locale, context)
+        if _etag_matches(request.headers.get("if-none-match", ""), etag_value):
+            return Response(status_code=304, headers={"ETag": etag_value, "Cache-Control": "no-cache"})
 
-    if template_path.endswith("_base.html"):
-        raise ValueError(f"Refusing to inject layout template directly: {template_path}")
+    translator, base_template = resolve_template(template_path, locale)
+    token = _current_translator.set(translator)
+    try:
+        if is_htmx:
+            return templates.TemplateResponse(template_path, context)
 
-    base_template = guess_base_template(template_path)
-    if base_template:
-        context["content_template"] = template_path
-        return templates.TemplateResponse(base_template, context)
+        if base_template:
+            context["content_template"] = template_path
+            response = templates.TemplateResponse(base_template, context)
+        else:
+            response = templates.TemplateResponse(template_path, context)
+    finally:
+        _current_translator.reset(token)
 
-    return templates.TemplateResponse(template_path, context)
+    if etag_value:
+        response.headers["ETag"] = etag_value
+        response.headers["Cache-Control"] = "no-cache"
+    return response
 
 
 def render_to_string(template_name: str, request: Request, context: dict) -> str:
@@ -175,5 +382,8 @@ def render_to_string(template_name: str, request: Request, context: dict) -> str
         str: The rendered template as a string.
     """
     context["request"] = request
-    apply_module_locale(env, template_name, request)
-    return templates.get_template(template_name).render(context)
+    token = apply_module_locale(template_name, request)
+    try:
+        return templates.get_template(template_name).render(context)
+    finally:
+        _current_translator.reset(token)
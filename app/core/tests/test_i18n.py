@@ -0,0 +1,87 @@
+import polib
+
+from app.core.i18n.locale import (
+    DOMAIN,
+    _load_translation,
+    clear_translation_cache,
+    compile_translations,
+    get_translations,
+)
+
+
+def _write_po(i18n_root, locale, entries):
+    po = polib.POFile()
+    po.metadata = {"Content-Type": "text/plain; charset=utf-8"}
+    for msgid, msgstr in entries.items():
+        po.append(polib.POEntry(msgid=msgid, msgstr=msgstr))
+    po_dir = i18n_root / locale / "LC_MESSAGES"
+    po_dir.mkdir(parents=True, exist_ok=True)
+    po.save(str(po_dir / f"{DOMAIN}.po"))
+
+
+def test_get_translations_reuses_loaded_catalog(tmp_path):
+    """
+    Test that compiled catalogs translate strings and are loaded only once per (root, locale).
+    """
+    _write_po(tmp_path, "fr", {"Hello": "Bonjour"})
+    compile_translations(tmp_path)
+    _load_translation.cache_clear()
+
+    first = get_translations(tmp_path, "fr")
+    second = get_translations(tmp_path, "fr")
+
+    assert first("Hello") == "Bonjour"
+    assert first.__self__ is second.__self__
+    assert _load_translation.cache_info().hits == 1
+
+
+def test_get_translations_falls_back_to_identity(tmp_path):
+    """
+    Test that a missing catalog yields an identity translator.
+    """
+    translate = get_translations(tmp_path, "de")
+    assert translate("Hello") == "Hello"
+
+
+def test_compile_translations_skips_up_to_date_catalogs(tmp_path):
+    """
+    Test that an existing .mo newer than its .po is not rewritten.
+    """
+    _write_po(tmp_path, "fr", {"Hello": "Bonjour"})
+    compile_translations(tmp_path)
+    mo_path = tmp_path / "fr" / "LC_MESSAGES" / f"{DOMAIN}.mo"
+    mtime = mo_path.stat().st_mtime_ns
+
+    compile_translations(tmp_path)
+
+    assert mo_path.stat().st_mtime_ns == mtime
+
+
+def test_compile_translations_handles_multiple_locales(tmp_path):
+    """
+    Test that every stale locale is compiled when several are pending.
+    """
+    for locale in ("fr", "es", "de"):
+        _write_po(tmp_path, locale, {"Hello": f"Hello-{locale}"})
+
+    compile_translations(tmp_path)
+
+    for locale in ("fr", "es", "de"):
+        assert (tmp_path / locale / "LC_MESSAGES" / f"{DOMAIN}.mo").exists()
+
+
+def test_clear_translation_cache_picks_up_recompiled_catalog(tmp_path):
+    """
+    Test that a recompiled catalog is served after the translation cache is cleared.
+    """
+    _write_po(tmp_path, "fr", {"Hello": "Bonjour"})
+    compile_translations(tmp_path)
+    assert get_translations(tmp_path, "fr")("Hello") == "Bonjour"
+
+    _write_po(tmp_path, "fr", {"Hello": "Salut"})
+    mo_path = tmp_path / "fr" / "LC_MESSAGES" / f"{DOMAIN}.mo"
+    mo_path.unlink()  # Force recompilation regardless of mtime resolution
+    compile_translations(tmp_path)
+    clear_translation_cache()
+
+    assert get_translations(tmp_path, "fr")("Hello") == "Salut"
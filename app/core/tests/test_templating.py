@@ -0,0 +1,165 @@
+import pytest
+from starlette.requests import Request
+
+import app.core.templating.template_utils as template_utils
+
+from app.core.config.config import settings
+from app.core.templating.template_utils import (
+    _etag_salt,
+    _current_translator,
+    apply_module_locale,
+    compute_etag,
+    enable_bytecode_cache,
+    env,
+    get_template_meta,
+    guess_base_template,
+    render,
+    resolve_template,
+)
+
+
+def test_guess_base_template_for_core_template():
+    """
+    Test that a core template resolves to the base layout of its core sub-package.
+    """
+    assert guess_base_template("base.html") == "ui_base.html"
+
+
+def test_guess_base_template_unknown_template():
+    """
+    Test that a template missing from every template directory has no base layout.
+    """
+    assert guess_base_template("does/not/exist.html") is None
+
+
+def test_template_index_resolves_core_i18n_root():
+    """
+    Test that the startup index attaches the core i18n directory to core templates.
+    """
+    meta = get_template_meta("components/button.html")
+    assert meta.kind == "core"
+    assert meta.i18n_root == settings.CORE_DIR / "i18n"
+
+
+def test_apply_module_locale_is_scoped_to_context():
+    """
+    Test that applying a locale swaps the context translator without touching shared env globals.
+    """
+    request = Request({"type": "http", "headers": [(b"cookie", b"locale=fr")]})
+    translate_global = env.globals["_"]
+    default_translator = _current_translator.get()
+
+    token = apply_module_locale("base.html", request)
+    try:
+        assert env.globals["_"] is translate_global
+        assert _current_translator.get() is not default_translator
+    finally:
+        _current_translator.reset(token)
+
+    assert _current_translator.get() is default_translator
+
+
+def test_render_refuses_base_layout_for_full_page_requests():
+    """
+    Test that a base layout cannot be rendered directly outside HTMX requests.
+    """
+    request = Request({"type": "http", "headers": []})
+    with pytest.raises(ValueError):
+        render("ui_base.html", request, {})
+
+
+def test_resolve_template_returns_translator_and_base_layout():
+    """
+    Test that a single resolution yields both the translator and the base layout.
+    """
+    translate, base_template = resolve_template("base.html", "en")
+    assert translate("Hello") == "Hello"
+    assert base_template == "ui_base.html"
+
+
+def test_render_returns_not_modified_for_matching_etag(monkeypatch):
+    """
+    Test that an opted-in full-page GET whose If-None-Match matches the ETag is answered with 304.
+    """
+    monkeypatch.setattr(env, "auto_reload", False)
+    etag = compute_etag("base.html", "en", {"title": "Home"})
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"if-none-match", etag.encode())],
+    })
+
+    response = render("base.html", request, {"title": "Home"}, etag=True)
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+@pytest.mark.parametrize("if_none_match", ["W/{etag}", '"other", W/{etag}', "*"])
+def test_render_uses_weak_comparison_for_if_none_match(monkeypatch, if_none_match):
+    """
+    Test that weak validators and the `*` wildcard in If-None-Match are answered with 304.
+    """
+    monkeypatch.setattr(env, "auto_reload", False)
+    etag = compute_etag("base.html", "en", {"title": "Home"})
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"if-none-match", if_none_match.format(etag=etag).encode())],
+    })
+
+    response = render("base.html", request, {"title": "Home"}, etag=True)
+
+    assert response.status_code == 304
+
+
+def test_render_tags_full_page_with_etag_when_not_matching(monkeypatch):
+    """
+    Test that a non-matching If-None-Match is ignored and the rendered page carries the ETag headers.
+    """
+    from app.main import app
+
+    monkeypatch.setattr(env, "auto_reload", False)
+    monkeypatch.setattr(template_utils, "resolve_template", lambda template_path, locale: (lambda s: s, None))
+    request = Request({
+        "type": "http",
+        "method": "GET",
+        "scheme": "http",
+        "server": ("testserver", 80),
+        "path": "/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"if-none-match", b'"stale"')],
+        "app": app,
+        "router": app.router,
+    })
+
+    response = render("base.html", request, {"title": "Home"}, etag=True)
+
+    assert response.status_code == 200
+    assert response.headers["etag"] == compute_etag("base.html", "en", {"title": "Home"})
+    assert response.headers["cache-control"] == "no-cache"
+
+
+def test_enable_bytecode_cache_falls_back_when_directory_is_unwritable(tmp_path, monkeypatch):
+    """
+    Test that an uncreatable cache directory leaves the environment without a persistent cache.
+    """
+    monkeypatch.setattr(env, "bytecode_cache", None)
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("")
+
+    assert enable_bytecode_cache(env, blocker / "cache") is False
+    assert env.bytecode_cache is None
+
+
+def test_etag_salt_skips_unstatable_files(tmp_path):
+    """
+    Test that a dangling symlink does not break the salt, while a newer file still changes it.
+    """
+    (tmp_path / "dangling.mo").symlink_to(tmp_path / "missing.mo")
+    salt = _etag_salt([tmp_path])
+
+    (tmp_path / "messages.mo").write_bytes(b"")
+
+    assert _etag_salt([tmp_path]) != salt
@@ -1,6 +1,9 @@
+import asyncio
 from contextlib import asynccontextmanager
 from setup.compiler import compile_tailwind
+from app.core.config.config import settings
 from app.core.i18n import compile_all_translations
+from app.core.templating.template_utils import enable_bytecode_cache, env, refresh_etag_salt
 
 @asynccontextmanager
 async def app_lifespan(app):
@@ -8,8 +11,11 @@ async def app_lifespan(app):
     Asynchronous context manager for managing the application's lifespan.
 
     This function performs the following tasks during the application's lifespan:
-    1. Compiles all translation files at startup by calling `compile_all_translations()`.
-    2. Starts the Tailwind CSS compiler by calling `compile_tailwind()` and ensures it is terminated gracefully on shutdown.
+    1. Enables the persistent Jinja2 bytecode cache in `settings.JINJA_CACHE_DIR` via `enable_bytecode_cache()`.
+    2. Compiles all translation files at startup by running `compile_all_translations()` in a worker thread.
+    3. Starts the Tailwind CSS compiler by calling `compile_tailwind()`, and ensures it is terminated gracefully on shutdown.
+    4. Waits for the translations to finish compiling before serving requests.
+    5. Recomputes the ETag salt via `refresh_etag_salt()` so it covers the freshly compiled catalogs.
 
     Args:
         app: The application instance.
@@ -18,15 +24,23 @@ async def app_lifespan(app):
         None. Used for managing setup and teardown logic.
 
     Exceptions:
+        If startup fails (e.g. `compile_tailwind()` exits), the translation task is still awaited.
         Any exceptions raised during compiler termination are caught and ignored to ensure graceful shutdown.
     """
-    compile_all_translations()
+    enable_bytecode_cache(env, settings.JINJA_CACHE_DIR)
 
+    translations = None
     compiler = None
     try:
+        translations = asyncio.create_task(asyncio.to_thread(compile_all_translations))
         compiler = compile_tailwind()
+        await translations
+        refresh_etag_salt()
         yield
     finally:
+        if translations is not None:
+            # Never leave the worker thread running or its exception unretrieved if startup failed
+            await asyncio.gather(translations, return_exceptions=True)
         if compiler:
             try:
                 compiler.terminate()
@@ -6,10 +6,9 @@ def mount_static_dirs(app):
     Mounts static directories to the given ASGI application.
 
     This function mounts the main static directory and a 'libs' directory to the app.
-    It also iterates through additional static directories defined in `settings.STATIC_DIRS`
-    and mounts them under `/static/{module_name}` if they exist and are directories.
-    The module name is inferred from the directory structure. Invalid or non-existent
-    directories are skipped gracefully.
+    It also mounts each module static directory in `settings.MODULE_STATIC_DIRS` under
+    `/static/{module_name}`. Missing directories are already filtered out when the settings
+    are resolved, so no filesystem checks happen here. Invalid mounts are skipped gracefully.
 
     Args:
         app: The ASGI application instance to which static directories will be mounted.
@@ -22,12 +21,8 @@ def mount_static_dirs(app):
     app.mount("/libs", StaticFiles(directory=settings.APP_DIR / "libs"), name="libs")
 
     # Conditionally mount module-level statics
-    for path in settings.STATIC_DIRS[1:]:
-        if path.exists() and path.is_dir():
-            module_name = (
-                path.parts[-2] if path.parts[-1] == "static" else path.parts[-1]
-            )
-            try:
-                app.mount(f"/static/{module_name}", StaticFiles(directory=path), name=f"{module_name}-static")
-            except Exception:
-                continue  # Fail-safe: skip invalid mounts gracefully
+    for module_name, path in settings.MODULE_STATIC_DIRS:
+        try:
+            app.mount(f"/static/{module_name}", StaticFiles(directory=path), name=f"{module_name}-static")
+        except Exception:
+            continue  # Fail-safe: skip invalid mounts gracefully
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from fastapi import FastAPI
 from starlette.middleware.sessions import SessionMiddleware
 
@@ -5,6 +6,7 @@ from app.core.config.config import settings
 from app.core.utils.lifespan import app_lifespan
 from app.core.utils.static_mounts import mount_static_dirs
 
+@lru_cache(maxsize=1)
 def get_app() -> FastAPI:
     """
     Creates and configures the FastAPI application instance with custom settings, middleware, and routing.
@@ -13,7 +15,7 @@ def get_app() -> FastAPI:
     -----------------------
     1. Initializes the FastAPI app using a custom lifespan handler (`app_lifespan`) and additional kwargs from `settings.fastapi_kwargs`.
     2. Mounts static directories via `mount_static_dirs()` to serve frontend assets.
-    3. Adds session middleware using Starlette's `SessionMiddleware` with the specified secret key.
+    3. Adds session middleware using Starlette's `SessionMiddleware` with `settings.SESSION_SECRET`.
     4. Registers the onboarding router under the `/onboarding` prefix with the tag "onboarding".
 
     Returns:
@@ -24,6 +26,7 @@ def get_app() -> FastAPI:
     Notes:
     ------
     - The returned app instance is assigned to the module-level `app` variable for ASGI compatibility.
+    - The app is built once and cached; repeated calls return the same instance.
     - Designed for modular extension, additional routers or middleware can be added within this function.
     """
     
@@ -31,7 +34,7 @@ def get_app() -> FastAPI:
 
     mount_static_dirs(app)
 
-    app.add_middleware(SessionMiddleware, secret_key="<YOUR SECRET KEY>")
+    app.add_middleware(SessionMiddleware, secret_key=settings.SESSION_SECRET)
 
 
     return app
@@ -1,12 +1,25 @@
+import asyncio
+import httpx
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
 from app.main import app
 
-@pytest.fixture
-def client():
-    return TestClient(app)
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    try:
+        import uvloop
+        return {"uvloop": uvloop.new_event_loop}
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
 
 @pytest.fixture(scope="session")
-def event_loop():
-    import asyncio
-    return asyncio.get_event_loop()
+def client():
+    # Not entered as a context manager: that would run app_lifespan, which starts the Tailwind watcher.
+    yield TestClient(app)
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
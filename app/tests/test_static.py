@@ -0,0 +1,9 @@
+async def test_core_static_assets_are_served(aclient):
+    """
+    Test that core static files and vendored libraries are mounted on the app.
+    """
+    css = await aclient.get("/static/css/app.css")
+    htmx = await aclient.get("/libs/htmx.min.js")
+
+    assert css.status_code == 200
+    assert htmx.status_code == 200